@@ -58,11 +58,7 @@ class Normal(RandomVector):
         mean: Union[B.Numeric, AbstractMatrix],
         var: Union[B.Numeric, AbstractMatrix],
     ):
-        self._mean = mean
-        self._mean_is_zero = None
-        self._var = var
-        self._var_diag = None
-        self._construct_var_diag = None
+        self._init_mean_var(mean, var)
 
     @_dispatch
     def __init__(self, var: Union[B.Numeric, AbstractMatrix]):
@@ -87,11 +83,37 @@ class Normal(RandomVector):
         self._construct_var_diag = var_diag
         self._construct_mean_var = mean_var
         self._construct_mean_var_diag = mean_var_diag
+        self._m2 = None
 
     @_dispatch
     def __init__(self, var: FunctionType, **kw_args):
         Normal.__init__(self, lambda: 0, var, **kw_args)
 
+    def _init_mean_var(self, mean, var):
+        self._mean = mean
+        self._mean_is_zero = None
+        self._var = var
+        self._var_diag = None
+        self._construct_var_diag = None
+        self._m2 = None
+
+    @classmethod
+    def _from_mean_var(cls, mean, var):
+        """Construct a normal from a mean and a variance without going through the
+        dispatch of `__init__`. Only use this when `mean` and `var` are known to be of
+        valid types, e.g. in arithmetic.
+
+        Args:
+            mean (column vector): Mean of the distribution.
+            var (matrix): Variance of the distribution.
+
+        Returns:
+            :class:`.Normal`: Normal distribution.
+        """
+        dist = cls.__new__(cls)
+        dist._init_mean_var(mean, var)
+        return dist
+
     def _resolve_mean(self, construct_zeros):
         if self._mean is None:
             self._mean = self._construct_mean()
@@ -106,7 +128,9 @@ class Normal(RandomVector):
         if self._var is None:
             self._var = self._construct_var()
         # Ensure that the variance is a structured matrix for efficient operations.
-        self._var = convert(self._var, AbstractMatrix)
+        # Only convert once: `convert` goes through dispatch on every call.
+        if not isinstance(self._var, AbstractMatrix):
+            self._var = convert(self._var, AbstractMatrix)
 
     def _resolve_var_diag(self):
         if self._var_diag is None:
@@ -198,7 +222,9 @@ class Normal(RandomVector):
     @property
     def m2(self):
         """matrix: Second moment."""
-        return self.var + B.outer(B.squeeze(self.mean))
+        if self._m2 is None:
+            self._m2 = self.var + B.outer(B.squeeze(self.mean))
+        return self._m2
 
     def marginals(self):
         """Get the marginals.
@@ -268,11 +294,17 @@ class Normal(RandomVector):
                 available_x = B.take(x, available)
                 return Normal(available_mean, available_var).logpdf(available_x)
 
+        # Avoid constructing zeros and subtracting them if the mean is zero.
+        if not self.mean_is_zero:
+            x = B.subtract(x, self.mean)
+
+        var = self.var
         logpdfs = (
             -(
-                B.logdet(self.var)[..., None]  # Correctly line up with `iqf_diag`.
-                + B.cast(self.dtype, self.dim) * B.cast(self.dtype, B.log_2_pi)
-                + B.iqf_diag(self.var, B.subtract(x, self.mean))
+                B.logdet(var)[..., None]  # Correctly line up with `iqf_diag`.
+                # Fold the constant before casting to save a cast and a multiply.
+                + B.cast(self.dtype, self.dim * B.log_2_pi)
+                + B.iqf_diag(var, x)
             )
             / 2
         )
@@ -285,8 +317,7 @@ class Normal(RandomVector):
             scalar: The entropy.
         """
         return (
-            B.logdet(self.var)
-            + B.cast(self.dtype, self.dim) * B.cast(self.dtype, B.log_2_pi + 1)
+            B.logdet(self.var) + B.cast(self.dtype, self.dim * (B.log_2_pi + 1))
         ) / 2
 
     @_dispatch
@@ -300,8 +331,13 @@ class Normal(RandomVector):
         Returns:
             scalar: KL divergence.
         """
+        if self.mean_is_zero and other.mean_is_zero:
+            # The means coincide, so the quadratic form vanishes.
+            mean_part = 0
+        else:
+            mean_part = B.iqf_diag(other.var, other.mean - self.mean)[..., 0]
         return (
-            B.iqf_diag(other.var, other.mean - self.mean)[..., 0]
+            mean_part
             + B.ratio(self.var, other.var)
             + B.logdet(other.var)
             - B.logdet(self.var)
@@ -342,8 +378,10 @@ class Normal(RandomVector):
         """
         var = self.var
 
-        # Add noise.
+        # Add noise. Cast the noise to the data type of the variance to prevent it
+        # from promoting the data type of the samples.
         if noise is not None:
+            noise = B.cast(B.dtype_float(var), noise)
             var = B.add(var, B.fill_diag(noise, self.dim))
 
         # Perform sampling operation.
@@ -363,31 +401,35 @@ class Normal(RandomVector):
 
     @_dispatch
     def __add__(self, other: B.Numeric):
-        return Normal(B.add(self.mean, other), self.var)
+        return Normal._from_mean_var(B.add(self.mean, other), self.var)
 
     @_dispatch
     def __add__(self, other: "Normal"):
-        return Normal(
-            B.add(self.mean, other.mean),
-            B.add(self.var, other.var),
-        )
+        if self.mean_is_zero and other.mean_is_zero:
+            # Keep the mean lazily zero rather than constructing and adding zeros.
+            mean = 0
+        else:
+            mean = B.add(self.mean, other.mean)
+        return Normal._from_mean_var(mean, B.add(self.var, other.var))
 
     @_dispatch
     def __mul__(self, other: B.Numeric):
-        return Normal(
+        return Normal._from_mean_var(
             B.multiply(self.mean, other),
             B.multiply(self.var, B.multiply(other, other)),
         )
 
     def lmatmul(self, other):
-        return Normal(
-            B.matmul(other, self.mean),
+        # Structured `other`s, like diagonal matrices, are handled efficiently by
+        # `B.matmul`. Avoid the product with the mean altogether if it is zero.
+        return Normal._from_mean_var(
+            0 if self.mean_is_zero else B.matmul(other, self.mean),
             B.matmul(other, self.var, other, tr_c=True),
         )
 
     def rmatmul(self, other):
-        return Normal(
-            B.matmul(other, self.mean, tr_a=True),
+        return Normal._from_mean_var(
+            0 if self.mean_is_zero else B.matmul(other, self.mean, tr_a=True),
             B.matmul(other, self.var, other, tr_a=True),
         )
 
@@ -2,7 +2,8 @@ import lab as B
 import numpy as np
 import pytest
 from algebra.util import identical
-from matrix import Dense, Zero
+from matrix import Dense, Diagonal, Zero
+from mlkernels import EQ
 from plum import NotFoundLookupError
 from scipy.stats import multivariate_normal
 from stheno.random import Normal, RandomVector
@@ -64,6 +65,12 @@ def test_normal_mean_is_zero():
     # Check nonzero case.
     assert not Normal(B.randn(3, 1), B.eye(3)).mean_is_zero
 
+    # Adding two zero-mean normals should not construct zeros.
+    dist = Normal(B.eye(3)) + Normal(B.eye(3))
+    assert dist.mean_is_zero
+    assert identical(dist._mean, 0)
+    approx(dist.mean, B.zeros(3, 1))
+
 
 def test_normal_lazy_zero_mean():
     dist = Normal(lambda: B.eye(3))
@@ -160,6 +167,8 @@ def test_normal_lazy_mean_var_diag():
 
 def test_normal_m2(normal1):
     approx(normal1.m2, normal1.var + normal1.mean @ normal1.mean.T)
+    # The second moment should be computed only once.
+    assert normal1.m2 is normal1.m2
 
 
 def test_normal_marginals(normal1):
@@ -209,6 +218,26 @@ def test_normal_entropy(normal1):
     approx(normal1.entropy(), normal1_sp.entropy())
 
 
+def test_normal_cholesky_reuse(normal1, normal2, monkeypatch):
+    # Count the Cholesky decompositions computed by NumPy.
+    cholesky = np.linalg.cholesky
+    count = [0]
+
+    def counting_cholesky(a):
+        count[0] += 1
+        return cholesky(a)
+
+    monkeypatch.setattr(np.linalg, "cholesky", counting_cholesky)
+
+    # The Cholesky decomposition of the variance should be computed once and then be
+    # shared by all operations which require it.
+    normal1.logpdf(B.randn(3, 1))
+    normal1.entropy()
+    normal1.kl(normal2)
+    normal2.kl(normal1)
+    assert count[0] == 2
+
+
 def test_normal_kl(normal1, normal2):
     assert normal1.kl(normal1) < 1e-5
     assert normal1.kl(normal2) > 0.1
@@ -219,6 +248,13 @@ def test_normal_kl(normal1, normal2):
     kl = normal1.kl(normal2)
     approx(kl_est, kl, rtol=0.05)
 
+    # Test the case where both means are zero.
+    zero = B.zeros(3, 1)
+    approx(
+        Normal(normal1.var).kl(Normal(normal2.var)),
+        Normal(zero, normal1.var).kl(Normal(zero, normal2.var)),
+    )
+
 
 def test_normal_w2(normal1, normal2):
     assert normal1.w2(normal1) < 5e-5
@@ -245,6 +281,27 @@ def test_normal_sampling():
         approx(sample1, sample2)
 
 
+def test_normal_sampling_noise():
+    # The noise should be added to the variance before factorising it, because the
+    # variance by itself is too ill-conditioned to factorise in single precision.
+    x = B.linspace(np.float32, 0, 5, 50)
+    dist = Normal(EQ()(x))
+    samples = dist.sample(10_000, noise=0.01)
+    assert B.dtype(samples) == np.float32
+    approx(B.mean(samples), 0, atol=5e-2)
+    approx(B.std(samples, axis=1) ** 2, 1.01 * B.ones(50), atol=1e-1)
+
+    # Seeded samples and their data type should not depend on whether the variance has
+    # already been factorised.
+    var = B.cast(np.float32, B.eye(3) + 0.5)
+    dist1, dist2 = Normal(var), Normal(var)
+    dist2.logpdf(B.zeros(np.float32, 3, 1))
+    _, sample1 = dist1.sample(B.create_random_state(np.float32, seed=0), 2, noise=0.1)
+    _, sample2 = dist2.sample(B.create_random_state(np.float32, seed=0), 2, noise=0.1)
+    assert B.dtype(sample1) == B.dtype(sample2) == np.float32
+    approx(sample1, sample2)
+
+
 def test_normal_arithmetic(normal1, normal2):
     a = Dense(B.randn(3, 3))
     b = 5.0
@@ -255,6 +312,15 @@ def test_normal_arithmetic(normal1, normal2):
     approx(normal1.rmatmul(a).mean, a.T @ normal1.mean)
     approx(normal1.rmatmul(a).var, a.T @ normal1.var @ a)
 
+    # Test that matrix multiplication preserves structure and zero means.
+    d = Diagonal(B.rand(3))
+    dist = Normal(Diagonal(B.rand(3)))
+    for res in [dist.lmatmul(d), dist.rmatmul(d)]:
+        assert isinstance(res.var, Diagonal)
+        assert res.mean_is_zero
+        approx(res.var, d @ dist.var @ d)
+        approx(res.mean, B.zeros(3, 1))
+
     # Test multiplication.
     approx((normal1 * b).mean, normal1.mean * b)
     approx((normal1 * b).var, normal1.var * b**2)